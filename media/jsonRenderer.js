@@ -3,6 +3,7 @@
 //  Changes:
 //   * string disclosure func no longer has JSON.stringify
 //   * keys are no longer quoted
+//   * values cut short by the backend ("arepl/more" markers) can be loaded on click
 //
 // Copyright © 2013-2017 David Caldwell <david@porkrind.org>
 //
@@ -53,6 +54,10 @@
 // renderjson.set_property_list(property_list)
 //   Equivalent of JSON.stringify() `replacer` argument when it's an array
 //
+// renderjson.set_expand(expand_function)
+//   Accepts a function (path, start) => {} that asks for the rest of a value cut short.
+//   The answer should be passed to renderjson.show_expansion({path, start, value})
+//
 // Theming
 // -------
 // The HTML output uses a number of classes so that you can theme it the way
@@ -197,8 +202,10 @@ var module, window, define, renderjson = (function () {
                                 var key = keys[0];
 
 
-
-                                if (linevarid == 0) {
+                                if (key == "...") {
+                                // hits between the first and last ones were skipped by the backend
+                                append(os, themetext("syntax", "... " + singlevar[key] + " more ... "));
+                                } else if (linevarid == 0) {
                                 append(os, themetext(null, "", "key", key, "object syntax", ': '),
                                 _renderjson(options.replacer.call(singlevar, key, singlevar[key]), "", true, show_level - 1, options, false),
                                 linevarid != line.length ? themetext("syntax", " ") : [],
@@ -239,6 +246,8 @@ var module, window, define, renderjson = (function () {
 
 
 
+        if (ismore(json)) return more(json, my_indent, show_level, options);
+
         if (typeof (json) == "string" && json.length > options.max_string_length)
             return disclosure('"', json.substr(0, options.max_string_length) + " ...", '"', "string", function () {
                 return append(span("string"), themetext(null, my_indent, "string", json));
@@ -281,6 +290,10 @@ var module, window, define, renderjson = (function () {
             for (var i in keys) {
                 var k = keys[i];
                 if (!(k in json)) continue;
+                if (k == "..." && ismore(json[k])) {
+                    append(os, more(json[k], "", show_level - 1, options));
+                    continue;
+                }
                 append(os, themetext(null, "", "key", k, "object syntax", ': '),
                     _renderjson(options.replacer.call(json, k, json[k]), "", true, show_level - 1, options, false),
                     k != last ? themetext("syntax", ", ") : [],
@@ -293,6 +306,65 @@ var module, window, define, renderjson = (function () {
         });
     }
 
+    var more_tag = "arepl/more";
+    var text_tag = "arepl/text";
+    // markers waiting for the backend, by path and start
+    var pending = {};
+
+    var ismore = function (json) {
+        return json !== null && typeof (json) == "object" && json.constructor != Array && more_tag in json;
+    };
+
+    // renders a value the backend cut short, clicking it asks for the rest
+    var more = function (json, indent, show_level, options) {
+        var el = span("more");
+        if (text_tag in json)
+            append(el, themetext(null, indent, "string", '"' + json[text_tag]));
+        if (!("path" in json) || !options.expand) {
+            return append(el, themetext("syntax", "... " + json[more_tag] + " more"));
+        }
+        // only the link is replaced by the expansion, the start of a string stays
+        var link = span();
+        var key = JSON.stringify([json.path, json.start]);
+        append(link, A("... " + json[more_tag] + " more", "syntax", function () {
+            pending[key] = {el: link, show_level: show_level, options: options};
+            options.expand(json.path, json.start);
+        }));
+        return append(el, link);
+    };
+
+    // renders the items of an expansion in place of the marker it was asked for with
+    var show_expansion = function (expansion) {
+        var key = JSON.stringify([expansion.path, expansion.start]);
+        var waiting = pending[key];
+        if (!waiting) return;
+        delete pending[key];
+        var value = expansion.value;
+        var items = span("more");
+        var render = function (item) {
+            return _renderjson(item, "", true, waiting.show_level, waiting.options, false);
+        };
+        if (value === null || value === void 0) {
+            append(items, themetext("syntax", "... could not load the rest"));
+        } else if (typeof (value) == "string") {
+            append(items, themetext("string", value + '"'));
+        } else if (ismore(value)) {
+            append(items, render(value));
+        } else if (value.constructor == Array) {
+            for (var i = 0; i < value.length; i++)
+                append(items, render(value[i]), i != value.length - 1 ? themetext("syntax", ", ") : []);
+        } else {
+            var keys = Object.keys(value);
+            for (var j = 0; j < keys.length; j++) {
+                var k = keys[j];
+                if (k == "..." && ismore(value[k])) append(items, render(value[k]));
+                else append(items, themetext(null, "", "key", k, "object syntax", ': '), render(value[k]));
+                if (j != keys.length - 1) append(items, themetext("syntax", ", "));
+            }
+        }
+        waiting.el.parentNode.replaceChild(items, waiting.el);
+    };
+
     var renderjson = function renderjson(json) {
         var options = Object.assign({}, renderjson.options);
         options.replacer = typeof (options.replacer) == "function" ? options.replacer : function (k, v) {
@@ -331,6 +403,11 @@ var module, window, define, renderjson = (function () {
         renderjson.options.collapse_msg = collapse_msg;
         return renderjson;
     };
+    renderjson.set_expand = function (expand) {
+        renderjson.options.expand = expand;
+        return renderjson;
+    };
+    renderjson.show_expansion = show_expansion;
     renderjson.set_property_list = function (prop_list) {
         renderjson.options.property_list = prop_list;
         return renderjson;
@@ -90,6 +90,9 @@ export default class PreviewManager {
 
         let panel = this.previewContainer.start(basename(this.pythonEditorDoc.fileName));
         panel.onDidDispose(()=>this.dispose(), this, this.subscriptions)
+        panel.webview.onDidReceiveMessage(message => {
+            if(message.expand) this.PythonEvaluator.expand(message.expand.path, message.expand.start)
+        }, this, this.subscriptions)
         this.subscriptions.push(panel)
 
         this.startAndBindPython()
@@ -216,7 +219,27 @@ export default class PreviewManager {
             usePreviousVariables: true,
             showGlobalVars: settingsCached.get<boolean>('showGlobalVars'),
             default_filter_vars: settingsCached.get<string[]>('defaultFilterVars'),
-            default_filter_types: settingsCached.get<string[]>('defaultFilterTypes')
+            default_filter_types: settingsCached.get<string[]>('defaultFilterTypes'),
+            line_first_hits: settingsCached.get<number>('lineFirstHits'),
+            line_last_hits: settingsCached.get<number>('lineLastHits'),
+            max_captured_items: settingsCached.get<number>('maxCapturedItems'),
+            incremental_execution: settingsCached.get<boolean>('incrementalExecution'),
+            time_budget: settingsCached.get<number>('timeBudget'),
+            memory_budget: settingsCached.get<number>('memoryBudget'),
+            delta_variables: true,
+            variable_max_items: settingsCached.get<number>('variableMaxItems'),
+            variable_max_string_length: settingsCached.get<number>('variableMaxStringLength'),
+            variable_max_depth: settingsCached.get<number>('variableMaxDepth'),
+            array_preview_rows: settingsCached.get<number>('arrayPreviewRows'),
+            timing_trace_file: settingsCached.get<string>('timingTraceFile'),
+            capture_engine: settingsCached.get<string>('captureEngine'),
+            // code lines were padded so they line up with the editor
+            visible_lines: editor.visibleRanges.map(range => [range.start.line, range.end.line]),
+            trace_max_hits: settingsCached.get<number>('traceMaxHits'),
+            cache_results: settingsCached.get<boolean>('cacheResults'),
+            memoize_calls: settingsCached.get<boolean>('memoizeCalls'),
+            memo_memory_mb: settingsCached.get<number>('memoMemoryMb'),
+            memo_disk_mb: settingsCached.get<number>('memoDiskMb')
         }
         this.PythonEvaluator.execCode(data)
         this.runningStatus.show()
@@ -300,7 +323,7 @@ export default class PreviewManager {
             pythonOptions,
             pythonPath,
             env,
-        })
+        }, settings().get<boolean>("forkServer"))
         
         try {
             this.PythonEvaluator.start()
@@ -340,6 +363,7 @@ export default class PreviewManager {
         // this is bad - stderr should be handled seperately so user is aware its different
         // but better than not showing stderr at all, so for now printing it out and ill fix later
         this.PythonEvaluator.onStderr = this.previewContainer.handlePrint.bind(this.previewContainer)
+        this.PythonEvaluator.onExpansion = expansion => this.previewContainer.pythonPanelPreview.showExpansion(expansion)
         this.PythonEvaluator.onResult = result => {
             this.runningStatus.hide()
             this.previewContainer.handleResult(result)
@@ -370,7 +394,7 @@ export default class PreviewManager {
         vscode.workspace.onDidChangeTextDocument((e) => {
             const cachedSettings = settings()
             if(cachedSettings.get<string>("whenToExecute") == "afterDelay"){
-                let delay = cachedSettings.get<number>("delay");
+                let delay = this.runDelay(cachedSettings);
                 const restartExtraDelay = cachedSettings.get<number>("restartDelay");
                 delay += this.tolivecodeLogic.restartMode ? restartExtraDelay : 0
                 this.PythonEvaluator.debounce(this.onAnyDocChange.bind(this, e.document), delay)
@@ -384,6 +408,13 @@ export default class PreviewManager {
             
             this.change_line_view();
 
+            // the trace engine only recorded the lines that were visible, so the new ones need a run
+            const cachedSettings = settings()
+            if(event.textEditor == this.pythonEditor && cachedSettings.get<string>("captureEngine") == "trace"
+                && cachedSettings.get<string>("whenToExecute") == "afterDelay"){
+                this.PythonEvaluator.debounce(this.onAnyDocChange.bind(this, this.pythonEditorDoc), this.runDelay(cachedSettings))
+            }
+
 
             },this, this.subscriptions )
             
@@ -413,6 +444,16 @@ export default class PreviewManager {
     }
 
 
+    /**
+     * the delay setting, longer when runs are slow.
+     * A slow run started mid-typing would just be cancelled by the next keystroke, so we wait for a longer pause
+     */
+    private runDelay(cachedSettings: vscode.WorkspaceConfiguration){
+        const delay = cachedSettings.get<number>("delay")
+        const maxDelay = cachedSettings.get<number>("maxDelay")
+        return Math.max(delay, Math.min(this.PythonEvaluator.averageRunTime / 2, maxDelay))
+    }
+
     private onAnyDocChange(event: vscode.TextDocument){
         if(event == this.pythonEditorDoc){
 
@@ -435,7 +476,11 @@ export default class PreviewManager {
             try {
                 var curline = this.pythonEditor.visibleRanges[0].start.line;
                 this.previewContainer.pythonPanelPreview.startrange = curline;
-                const codeRan = this.tolivecodeLogic.onUserInput(text, filePath, vscodeUtils.eol(event), settings().get<boolean>('showGlobalVars'))
+                const visibleLines = this.pythonEditor.visibleRanges.map(range => [range.start.line, range.end.line])
+                const cancelledRuns = this.PythonEvaluator.cancelledRuns
+                const codeRan = this.tolivecodeLogic.onUserInput(text, filePath, vscodeUtils.eol(event), settings().get<boolean>('showGlobalVars'), visibleLines)
+                this.reporter.numCancelledRuns += this.PythonEvaluator.cancelledRuns - cancelledRuns
+                this.reporter.maxQueueDepth = Math.max(this.reporter.maxQueueDepth, this.PythonEvaluator.queueDepth)
                 if(codeRan) {
                      this.runningStatus.show();
                     
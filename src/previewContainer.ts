@@ -13,6 +13,14 @@ export class PreviewContainer{
     pythonInlinePreview: PythonInlinePreview
     public errorDecorationType: vscode.TextEditorDecorationType
     private vars: {}
+    /**
+     * variables of the last finished run, backend only sends what changed since then
+     */
+    private lastRunVars = {}
+    /**
+     * whether the vars shown in the panel include dumped variables
+     */
+    private showingDumps = false
 
     constructor(private reporter: Reporter, context: vscode.ExtensionContext, htmlUpdateFrequency=50, public pythonPanelPreview?: PythonPanelPreview){
         if(!this.pythonPanelPreview) this.pythonPanelPreview = new PythonPanelPreview(context, htmlUpdateFrequency)
@@ -22,6 +30,7 @@ export class PreviewContainer{
 
     public start(linkedFileName: string){
         this.clearStoredData()
+        this.lastRunVars = {}
         return this.pythonPanelPreview.start(linkedFileName)
     }
 
@@ -38,6 +47,8 @@ export class PreviewContainer{
         console.debug(`Exec time: ${pythonResults.execTime}`)
         console.debug(`Python time: ${pythonResults.totalPyTime}`)
         console.debug(`Total time: ${pythonResults.totalTime}`)
+        if(pythonResults.timings) console.debug(`Python timings: ${JSON.stringify(pythonResults.timings)}`)
+        if(pythonResults.cached) console.debug("Code did not change, result of last run was reused")
 
         this.reporter.execTime += pythonResults.execTime
         this.reporter.totalPyTime += pythonResults.totalPyTime
@@ -45,6 +56,10 @@ export class PreviewContainer{
 
         try {            
             
+            // whether there is anything new to show
+            let varsChanged = true
+            const hasDumps = Object.keys(this.vars).length > 0
+
             if(!pythonResults.done){
                 // user has dumped variables, add them to vars
                 this.updateVarsWithDumpOutput(pythonResults)
@@ -52,6 +67,21 @@ export class PreviewContainer{
             else{
                 // exec time is the 'truest' time that user cares about
                 this.pythonPanelPreview.updateTime(pythonResults.execTime);
+
+                if(pythonResults.delta){
+                    varsChanged = hasDumps || this.showingDumps
+                        || Object.keys(pythonResults.userVariables).length > 0
+                        || pythonResults.removedVariables.length > 0
+                    const lastRunVars = {...this.lastRunVars, ...pythonResults.userVariables}
+                    for(const name of pythonResults.removedVariables){
+                        delete lastRunVars[name]
+                    }
+                    this.lastRunVars = lastRunVars
+                }
+                else{
+                    this.lastRunVars = pythonResults.userVariables
+                }
+                pythonResults.userVariables = this.lastRunVars
             }
 
             this.vars = {...this.vars, ...pythonResults.userVariables}
@@ -66,8 +96,9 @@ export class PreviewContainer{
             // a result with a syntax error will not have any variables
             // So only update vars if there's not a syntax error
             // this is because it's annoying to user if they have a syntax error and all their variables dissapear
-            if(!syntaxError){
+            if(!syntaxError && varsChanged){
                 this.pythonPanelPreview.updateVars(this.vars)
+                if(pythonResults.done) this.showingDumps = hasDumps
             }
 
             if(pythonResults.internalError){
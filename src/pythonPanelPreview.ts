@@ -4,6 +4,7 @@ import * as vscode from "vscode"
 import {Limit} from "./throttle"
 import Utilities from "./utilities"
 import {settings} from "./settings"
+import {Expansion} from "arepl-backend"
 
 /**
  * shows AREPL output (variables, errors, timing, and stdout/stderr)
@@ -119,6 +120,11 @@ if r.status_code == 200:
                 let jsonRenderer = renderjson.set_icons('+', '-') // default icons look a bit wierd, overriding
                     .set_show_to_level(${settings().get("show_to_level")}) 
                     .set_max_string_length(${settings().get("max_string_length")});
+                const vscodeApi = acquireVsCodeApi()
+                // values cut short by the backend are loaded when clicked, see showExpansion
+                jsonRenderer.set_expand(function(path, start){
+                    vscodeApi.postMessage({expand: {path: path, start: start}})
+                })
                 document.getElementById("results").appendChild(jsonRenderer(userVars));
                 
                 var setscroll = ${this.startrange}
@@ -127,6 +133,10 @@ if r.status_code == 200:
                 // }
                 this.scrollTo(0, 19 * setscroll);
                 this.addEventListener("message", event => {
+                    if(event.data.expansion){
+                        renderjson.show_expansion(event.data.expansion)
+                        return
+                    }
 
                     var scrolllevel = event.data.line
                     // if (scrolllevel > 0) {
@@ -149,6 +159,13 @@ if r.status_code == 200:
     }
     // this.scroll(1000, 1000);
 
+    /**
+     * shows the rest of a variable the webview asked for
+     */
+    public showExpansion(expansion: Expansion){
+        this.panel.webview.postMessage({expansion})
+    }
+
     public updateTime(time: number){
         let color: "green"|"red";
 
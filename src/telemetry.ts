@@ -11,6 +11,8 @@ export default class Reporter{
     private lastStackTrace: string
     numRuns: number
     numInterruptedRuns: number
+    numCancelledRuns: number
+    maxQueueDepth: number
     execTime: number
     totalPyTime: number
     totalTime: number
@@ -57,6 +59,8 @@ export default class Reporter{
             measurements['timeSpent'] = (Date.now() - this.timeOpened)/1000
             measurements['numRuns'] = this.numRuns
             measurements['numInterruptedRuns'] = this.numInterruptedRuns
+            measurements['numCancelledRuns'] = this.numCancelledRuns
+            measurements['maxQueueDepth'] = this.maxQueueDepth
 
             if(this.numRuns != 0){
                 measurements['execTime'] = this.execTime / this.numRuns
@@ -92,6 +96,8 @@ export default class Reporter{
 
         this.numRuns = 0
         this.numInterruptedRuns = 0
+        this.numCancelledRuns = 0
+        this.maxQueueDepth = 0
         this.execTime = 0
         this.totalPyTime = 0
         this.totalTime = 0
@@ -31,7 +31,10 @@ export class ToAREPLLogic{
         return unsafeKeywordsRe.test(text)
     }
 
-    public onUserInput(text: string, filePath: string, eol: string, showGlobalVars=true) {
+    /**
+     * @param visibleLines [first, last] lines shown in the editor, the trace capture engine only records those
+     */
+    public onUserInput(text: string, filePath: string, eol: string, showGlobalVars=true, visibleLines: number[][]=[]) {
 
         const settingsCached = settings()
 
@@ -68,7 +71,29 @@ export class ToAREPLLogic{
             usePreviousVariables: settingsCached.get<boolean>('keepPreviousVars'),
             showGlobalVars,
             default_filter_vars: settingsCached.get<string[]>('defaultFilterVars'),
-            default_filter_types: settingsCached.get<string[]>('defaultFilterTypes')
+            default_filter_types: settingsCached.get<string[]>('defaultFilterTypes'),
+            line_first_hits: settingsCached.get<number>('lineFirstHits'),
+            line_last_hits: settingsCached.get<number>('lineLastHits'),
+            max_captured_items: settingsCached.get<number>('maxCapturedItems'),
+            incremental_execution: settingsCached.get<boolean>('incrementalExecution'),
+            time_budget: settingsCached.get<number>('timeBudget'),
+            memory_budget: settingsCached.get<number>('memoryBudget'),
+            delta_variables: true,
+            variable_max_items: settingsCached.get<number>('variableMaxItems'),
+            variable_max_string_length: settingsCached.get<number>('variableMaxStringLength'),
+            variable_max_depth: settingsCached.get<number>('variableMaxDepth'),
+            array_preview_rows: settingsCached.get<number>('arrayPreviewRows'),
+            timing_trace_file: settingsCached.get<string>('timingTraceFile'),
+            capture_engine: settingsCached.get<string>('captureEngine'),
+            // lines of the editor -> lines of evalCode, which starts after the saved section
+            visible_lines: visibleLines.map(([first, last]) => [first - startLineNum, last - startLineNum])
+                                       .filter(([first, last]) => last >= 0)
+                                       .map(([first, last]) => [Math.max(first, 0), last]),
+            trace_max_hits: settingsCached.get<number>('traceMaxHits'),
+            cache_results: settingsCached.get<boolean>('cacheResults'),
+            memoize_calls: settingsCached.get<boolean>('memoizeCalls'),
+            memo_memory_mb: settingsCached.get<number>('memoMemoryMb'),
+            memo_disk_mb: settingsCached.get<number>('memoDiskMb')
         }
 
         // user should be able to rerun code without changing anything
@@ -101,7 +126,7 @@ export class ToAREPLLogic{
      * checks syntax before restarting - if syntax error it doesnt bother restarting but instead just shows syntax error
      * This is useful because we want to restart as little as possible
      */
-    private checkSyntaxAndRestart(data: {evalCode: string, savedCode: string, filePath: string}){
+    private checkSyntaxAndRestart(data: ExecArgs){
         let syntaxPromise: Promise<{}>
     
         // #22 it might be faster to use checkSyntaxFile but this is simpler
@@ -126,13 +151,22 @@ export class ToAREPLLogic{
                 {
                     userVariables:{}, userError:null, userErrorMsg:<string>error, execTime: 0, totalPyTime: 0, totalTime: 0,
                     internalError: internalErr, caller: "", lineno: -1, done: true,
+                    delta: true, removedVariables: []
                 }
             )
         })
     }
     
-    private restartPython(data: {evalCode: string, savedCode: string, filePath: string}){
+    private restartPython(data: ExecArgs){
         this.previewContainer.clearStoredData()
+        if(this.PythonEvaluator.forkServer){
+            // no need to restart, the backend throws the old worker (and its GUI) away and forks a fresh one
+            data.freshProcess = true
+            // a GUI window stays open until the next run
+            if(this.restartMode) data.time_budget = 0
+            this.PythonEvaluator.execCode(data)
+            return
+        }
         this.PythonEvaluator.restart(
             this.PythonEvaluator.execCode.bind(this.PythonEvaluator, data)
         );     